@@ -0,0 +1,67 @@
+"""Overlap tests for batches of axis-aligned bounding boxes.
+
+The boxes are given as (N, 2, 3) arrays where the first row of each box is its minimum point and the second row its
+maximum point, like AxisAlignedBoundingBox.min_max. If numba is installed the all-pairs test is compiled to native code
+and parallelized over the boxes, otherwise an equivalent numpy implementation is used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ModuleNotFoundError:
+    _NUMBA_AVAILABLE = False
+    prange = range
+
+
+def overlaps(a_batch: np.ndarray, b_batch: np.ndarray) -> np.ndarray:
+    """
+    Checks pairwise if the axis-aligned bounding boxes of two batches overlap. The batches are (..., 2, 3) arrays as
+    created by AxisAlignedBoundingBox.from_arrays, they are broadcast against each other.
+
+    :param a_batch: The first batch of axis-aligned bounding boxes
+    :param b_batch: The second batch of axis-aligned bounding boxes
+    :return: A boolean array which is True where the boxes overlap
+    """
+    a_batch = np.asarray(a_batch)
+    b_batch = np.asarray(b_batch)
+    return np.all((a_batch[..., 0, :] <= b_batch[..., 1, :]) & (a_batch[..., 1, :] >= b_batch[..., 0, :]), axis=-1)
+
+
+def _overlaps_batch_kernel(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Checks every box of boxes_a against every box of boxes_b with six scalar comparisons per pair.
+    """
+    n = boxes_a.shape[0]
+    m = boxes_b.shape[0]
+    result = np.empty((n, m), dtype=np.bool_)
+    for i in prange(n):
+        for j in range(m):
+            result[i, j] = (boxes_a[i, 0, 0] <= boxes_b[j, 1, 0] and boxes_a[i, 1, 0] >= boxes_b[j, 0, 0]
+                            and boxes_a[i, 0, 1] <= boxes_b[j, 1, 1] and boxes_a[i, 1, 1] >= boxes_b[j, 0, 1]
+                            and boxes_a[i, 0, 2] <= boxes_b[j, 1, 2] and boxes_a[i, 1, 2] >= boxes_b[j, 0, 2])
+    return result
+
+
+if _NUMBA_AVAILABLE:
+    # No fastmath, it assumes that there are no NaNs and would let boxes with NaN coordinates overlap, unlike the
+    # numpy version. The compiled kernel is cached on disk to skip the compilation on later imports.
+    _overlaps_batch = njit(parallel=True, cache=True)(_overlaps_batch_kernel)
+else:
+    def _overlaps_batch(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+        return overlaps(boxes_a[:, None], boxes_b[None, :])
+
+
+def overlaps_batch(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Checks for all pairs of boxes from the two batches if they overlap.
+
+    :param boxes_a: The first batch of boxes as an (N, 2, 3) array.
+    :param boxes_b: The second batch of boxes as an (M, 2, 3) array.
+    :return: An (N, M) boolean array which is True where box i of boxes_a overlaps box j of boxes_b.
+    """
+    boxes_a = np.ascontiguousarray(boxes_a, dtype=np.float64).reshape(-1, 2, 3)
+    boxes_b = np.ascontiguousarray(boxes_b, dtype=np.float64).reshape(-1, 2, 3)
+    return _overlaps_batch(boxes_a, boxes_b)
+
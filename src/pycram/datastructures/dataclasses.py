@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing_extensions import List, Optional, Tuple, Callable, Dict, Any, Union, TYPE_CHECKING
-from .enums import JointType, Shape
+from dataclasses import dataclass, fields, is_dataclass
+from itertools import chain
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from typing import Optional, Callable, Any, Union, TYPE_CHECKING
+from .enums import Shape
 from .pose import Pose, Point
 from abc import ABC, abstractmethod
 
@@ -12,7 +16,7 @@ if TYPE_CHECKING:
     from ..world_concepts.constraints import Attachment
 
 
-def get_point_as_list(point: Point) -> List[float]:
+def get_point_as_list(point: Point) -> list[float]:
     """
     Returns the point as a list.
 
@@ -22,51 +26,203 @@ def get_point_as_list(point: Point) -> List[float]:
     return [point.x, point.y, point.z]
 
 
-@dataclass
+def _get_slots(cls: type) -> tuple[str, ...]:
+    """
+    Returns the names of the slots that are declared directly on the given class.
+
+    :param cls: The class.
+    :return: The names of the slots of the class.
+    """
+    slots = cls.__dict__.get('__slots__', ())
+    return (slots,) if isinstance(slots, str) else tuple(slots)
+
+
+def _update_class_cell(value: Any, old_cls: type, new_cls: type) -> None:
+    """
+    Points the __class__ cell of a method, which is used by zero argument super(), from the old to the new class.
+
+    :param value: The value from the class dict, e.g. a function, classmethod or property.
+    :param old_cls: The class the cell currently refers to.
+    :param new_cls: The class the cell should refer to.
+    """
+    if isinstance(value, (classmethod, staticmethod)):
+        value = value.__func__
+    functions = (value.fget, value.fset, value.fdel) if isinstance(value, property) else (value,)
+    for function in functions:
+        for cell in getattr(function, '__closure__', None) or ():
+            if cell.cell_contents is old_cls:
+                cell.cell_contents = new_cls
+
+
+def slotted_dataclass(cls: Optional[type] = None, **kwargs):
+    """
+    Creates a dataclass whose instances store their fields in __slots__ instead of a per-instance __dict__, which
+    reduces the memory of each instance and speeds up attribute access. This is the equivalent of
+    dataclass(slots=True) which is only available from python 3.10 on. Each class in an inheritance chain only declares
+    the slots of its own fields, such that the whole MRO stays free of a __dict__.
+
+    :param cls: The class that should be turned into a slotted dataclass.
+    :param kwargs: Keyword arguments that are passed to dataclass (e.g. eq, repr).
+    :return: The slotted dataclass, or a decorator creating it if no class was given.
+    """
+    def wrap(cls_: type) -> type:
+        cls_ = dataclass(cls_, **kwargs)
+        cls_dict = dict(cls_.__dict__)
+        inherited_slots = set(chain.from_iterable(map(_get_slots, cls_.__mro__[1:-1])))
+        field_names = tuple(f.name for f in fields(cls_))
+        cls_dict['__slots__'] = tuple(name for name in field_names if name not in inherited_slots)
+        # The defaults are stored in the generated __init__, keeping them as class attributes would collide with the
+        # slot descriptors.
+        for name in field_names:
+            cls_dict.pop(name, None)
+        cls_dict.pop('__dict__', None)
+        cls_dict.pop('__weakref__', None)
+        new_cls = type(cls_)(cls_.__name__, cls_.__bases__, cls_dict)
+        new_cls.__qualname__ = cls_.__qualname__
+        for value in cls_dict.values():
+            _update_class_cell(value, cls_, new_cls)
+        return new_cls
+
+    return wrap if cls is None else wrap(cls)
+
+
+def fast_pickle(cls: type) -> type:
+    """
+    Generates __getstate__ and __setstate__ methods for the given class that save the fields, or the slots if the class
+    is not a dataclass, as a plain tuple and restore them positionally. This avoids the generic state dict of the
+    default pickle protocol and also works for immutable classes since the values are set with object.__setattr__.
+
+    :param cls: The class that should be pickled with the generated methods.
+    :return: The class with the generated methods.
+    """
+    if is_dataclass(cls):
+        names = tuple(f.name for f in fields(cls))
+    else:
+        names = tuple(chain.from_iterable(map(_get_slots, reversed(cls.__mro__))))
+    values = "".join(f"self.{name}, " for name in names)
+    assignments = "".join(f"    _set(self, '{name}', state[{i}])\n" for i, name in enumerate(names))
+    namespace = {}
+    exec(f"def __getstate__(self):\n    return ({values})\n"
+         f"def __setstate__(self, state):\n{assignments or '    pass'}\n",
+         {'_set': object.__setattr__}, namespace)
+    for name, fn in namespace.items():
+        fn.__qualname__ = f"{cls.__qualname__}.{name}"
+        setattr(cls, name, fn)
+    return cls
+
+
+def _make_from_seq(n: int, name: Optional[str] = None, factory: Optional[str] = None) -> classmethod:
+    """
+    Generates a classmethod that creates an instance from the first n elements of a sequence. The positional unpacking
+    is compiled once into the method, such that no length checks or loops are executed when it is called.
+
+    :param n: The number of elements that are passed to the constructor.
+    :param name: The name of the generated method, defaults to from_list<n>.
+    :param factory: The name of a classmethod that should be called instead of the constructor.
+    :return: The generated classmethod.
+    """
+    name = name or f"from_list{n}"
+    constructor = f"cls.{factory}" if factory else "cls"
+    args = ", ".join(f"seq[{i}]" for i in range(n))
+    namespace = {}
+    exec(f"def {name}(cls, seq):\n    return {constructor}({args})\n", {}, namespace)
+    fn = namespace[name]
+    fn.__doc__ = f"Creates an instance from the first {n} elements of the given sequence."
+    return classmethod(fn)
+
+
+@fast_pickle
 class Color:
     """
-    Dataclass for storing rgba_color as an RGBA value.
+    Class for storing rgba_color as an RGBA value.
     The values are stored as floats between 0 and 1.
     The default rgba_color is white. 'A' stands for the opacity.
+    Equal colors can share one read-only instance which is returned by Color.get.
     """
-    R: float = 1
-    G: float = 1
-    B: float = 1
-    A: float = 1
+    __slots__ = ('R', 'G', 'B', 'A')
+
+    # Shared instances by their class and their RGBA values quantized to 16 bit, and by their class and the exact
+    # RGBA values they were requested with, which skips the quantization for repeated values. Both tables are emptied
+    # once they hold _INTERN_SIZE entries such that reading many different colors does not grow them without bound.
+    _INTERN = {}
+    _INTERN_EXACT = {}
+    _INTERN_SIZE = 4096
+
+    from_list3 = _make_from_seq(3, factory="get")
+    from_list4 = _make_from_seq(4, factory="get")
+
+    # Constructors for lists of RGB and RGBA values by their length as plain functions that take the class, set after
+    # the class is created
+    _FROM_LIST = None
+
+    def __init__(self, R: float = 1, G: float = 1, B: float = 1, A: float = 1):
+        self.R = R
+        self.G = G
+        self.B = B
+        self.A = A
 
     @classmethod
-    def from_list(cls, color: List[float]):
+    def get(cls, R: float = 1, G: float = 1, B: float = 1, A: float = 1) -> Color:
+        """
+        Returns the shared instance of this class for the given RGBA values, the instance is created on the first call.
+        Values that only differ below 16 bit precision share the same instance. The shared instance is read-only, create
+        a new Color to get a color that can be changed. NaN and infinite values can not be quantized, for them a new
+        Color is returned.
+
+        :param R: The red value
+        :param G: The green value
+        :param B: The blue value
+        :param A: The opacity
+        :return: The shared Color instance
+        """
+        exact_key = (cls, R, G, B, A)
+        color = cls._INTERN_EXACT.get(exact_key)
+        if color is not None:
+            return color
+        try:
+            key = (cls, int(R * 65535), int(G * 65535), int(B * 65535), int(A * 65535))
+        except (ValueError, OverflowError):
+            return cls(R, G, B, A)
+        if len(cls._INTERN_EXACT) >= cls._INTERN_SIZE:
+            cls._INTERN.clear()
+            cls._INTERN_EXACT.clear()
+        color = cls._INTERN.get(key)
+        if color is None:
+            color = cls._INTERN[key] = _get_shared_class(cls)(R, G, B, A)
+        cls._INTERN_EXACT[exact_key] = color
+        return color
+
+    @classmethod
+    def from_list(cls, color: list[float]):
         """
         Sets the rgba_color from a list of RGBA values.
 
         :param color: The list of RGBA values
         """
-        if len(color) == 3:
-            return cls.from_rgb(color)
-        elif len(color) == 4:
-            return cls.from_rgba(color)
-        else:
+        from_list = cls._FROM_LIST.get(len(color))
+        if from_list is None:
             raise ValueError("Color list must have 3 or 4 elements")
+        return from_list(cls, color)
 
     @classmethod
-    def from_rgb(cls, rgb: List[float]):
+    def from_rgb(cls, rgb: list[float]):
         """
         Sets the rgba_color from a list of RGB values.
 
         :param rgb: The list of RGB values
         """
-        return cls(rgb[0], rgb[1], rgb[2], 1)
+        return cls.from_list3(rgb)
 
     @classmethod
-    def from_rgba(cls, rgba: List[float]):
+    def from_rgba(cls, rgba: list[float]):
         """
         Sets the rgba_color from a list of RGBA values.
 
         :param rgba: The list of RGBA values
         """
-        return cls(rgba[0], rgba[1], rgba[2], rgba[3])
+        return cls.from_list4(rgba)
 
-    def get_rgba(self) -> List[float]:
+    def get_rgba(self) -> list[float]:
         """
         Returns the rgba_color as a list of RGBA values.
 
@@ -74,7 +230,7 @@ class Color:
         """
         return [self.R, self.G, self.B, self.A]
 
-    def get_rgb(self) -> List[float]:
+    def get_rgb(self) -> list[float]:
         """
         Returns the rgba_color as a list of RGB values.
 
@@ -82,30 +238,136 @@ class Color:
         """
         return [self.R, self.G, self.B]
 
+    def __eq__(self, other):
+        if not isinstance(other, Color):
+            return NotImplemented
+        return self.R == other.R and self.G == other.G and self.B == other.B and self.A == other.A
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Color(R={self.R}, G={self.G}, B={self.B}, A={self.A})"
+
+
+class _SharedColor:
+    """
+    Mixin for the Colors that are shared between all callers of Color.get and can therefore not be changed.
+    """
+    __slots__ = ()
+
+    def __init__(self, R: float, G: float, B: float, A: float):
+        object.__setattr__(self, 'R', R)
+        object.__setattr__(self, 'G', G)
+        object.__setattr__(self, 'B', B)
+        object.__setattr__(self, 'A', A)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Colors returned by Color.get are shared and can not be changed, create a new Color")
+
+    def __delattr__(self, key):
+        raise AttributeError("Colors returned by Color.get are shared and can not be changed, create a new Color")
+
+    def __reduce__(self):
+        return self._color_class.get, (self.R, self.G, self.B, self.A)
+
+
+# Read-only subclass of each Color class for its shared instances
+_SHARED_COLOR_CLASSES: dict[type, type] = {}
+
+
+def _get_shared_class(cls: type) -> type:
+    """
+    Returns the read-only subclass of the given Color class for the instances shared by Color.get, the subclass is
+    created on the first call.
+
+    :param cls: The Color class.
+    :return: The read-only subclass of the Color class.
+    """
+    shared_cls = _SHARED_COLOR_CLASSES.get(cls)
+    if shared_cls is None:
+        shared_cls = _SHARED_COLOR_CLASSES[cls] = type(cls.__name__, (_SharedColor, cls),
+                                                       {'__slots__': (), '__qualname__': cls.__qualname__,
+                                                        '__module__': cls.__module__, '_color_class': cls})
+    return shared_cls
+
+
+Color._FROM_LIST = {3: Color.from_list3.__func__, 4: Color.from_list4.__func__}
+
 
-@dataclass
 class AxisAlignedBoundingBox:
     """
-    Dataclass for storing an axis-aligned bounding box.
+    Class for storing an axis-aligned bounding box.
+    The box is stored as a tuple of the six coordinates for cheap access to single values and as a (2, 3) array where
+    the first row is the minimum point and the second row is the maximum point, such that many boxes can be processed
+    with vectorized numpy operations. The array is only created when it is first requested, it is read-only such that
+    views of it can be handed out safely.
     """
-    min_x: float
-    min_y: float
-    min_z: float
-    max_x: float
-    max_y: float
-    max_z: float
+    __slots__ = ('_values', '_min_max')
+
+    def __init__(self, min_max: np.ndarray):
+        self._min_max = np.array(min_max, dtype=np.float64).reshape(2, 3)
+        self._min_max.flags.writeable = False
+        self._values = tuple(self._min_max.ravel().tolist())
 
     @classmethod
-    def from_min_max(cls, min_point: List[float], max_point: List[float]):
+    def from_min_max(cls, min_point: list[float], max_point: list[float]):
         """
         Sets the axis-aligned bounding box from a minimum and maximum point.
 
         :param min_point: The minimum point
         :param max_point: The maximum point
         """
-        return cls(min_point[0], min_point[1], min_point[2], max_point[0], max_point[1], max_point[2])
+        box = cls.__new__(cls)
+        box._values = (min_point[0], min_point[1], min_point[2], max_point[0], max_point[1], max_point[2])
+        box._min_max = None
+        return box
+
+    @classmethod
+    def from_arrays(cls, mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+        """
+        Creates a batch of axis-aligned bounding boxes from arrays of minimum and maximum points.
 
-    def get_min_max_points(self) -> Tuple[Point, Point]:
+        :param mins: The minimum points as an (N, 3) array
+        :param maxs: The maximum points as an (N, 3) array
+        :return: The batch of axis-aligned bounding boxes as an (N, 2, 3) array
+        """
+        return np.stack([np.asarray(mins, dtype=np.float64), np.asarray(maxs, dtype=np.float64)], axis=1)
+
+    @property
+    def min_max(self) -> np.ndarray:
+        """
+        The axis-aligned bounding box as a read-only (2, 3) array of the minimum and maximum point.
+        """
+        if self._min_max is None:
+            self._min_max = np.array(self._values, dtype=np.float64).reshape(2, 3)
+            self._min_max.flags.writeable = False
+        return self._min_max
+
+    @property
+    def min_x(self) -> float:
+        return self._values[0]
+
+    @property
+    def min_y(self) -> float:
+        return self._values[1]
+
+    @property
+    def min_z(self) -> float:
+        return self._values[2]
+
+    @property
+    def max_x(self) -> float:
+        return self._values[3]
+
+    @property
+    def max_y(self) -> float:
+        return self._values[4]
+
+    @property
+    def max_z(self) -> float:
+        return self._values[5]
+
+    def get_min_max_points(self) -> tuple[Point, Point]:
         """
         Returns the axis-aligned bounding box as a tuple of minimum and maximum points.
 
@@ -119,7 +381,7 @@ class AxisAlignedBoundingBox:
 
         :return: The axis-aligned bounding box as a minimum point
         """
-        return Point(self.min_x, self.min_y, self.min_z)
+        return Point(*self._values[:3])
 
     def get_max_point(self) -> Point:
         """
@@ -127,9 +389,18 @@ class AxisAlignedBoundingBox:
 
         :return: The axis-aligned bounding box as a maximum point
         """
-        return Point(self.max_x, self.max_y, self.max_z)
+        return Point(*self._values[3:])
+
+    def as_array(self) -> np.ndarray:
+        """
+        Returns the axis-aligned bounding box as a (2, 3) array of the minimum and maximum point, this is the
+        underlying read-only array and not a copy.
 
-    def get_min_max(self) -> Tuple[List[float], List[float]]:
+        :return: The axis-aligned bounding box as an array
+        """
+        return self.min_max
+
+    def get_min_max(self) -> tuple[np.ndarray, np.ndarray]:
         """
         Returns the axis-aligned bounding box as a tuple of minimum and maximum points.
 
@@ -137,50 +408,140 @@ class AxisAlignedBoundingBox:
         """
         return self.get_min(), self.get_max()
 
-    def get_min(self) -> List[float]:
+    def get_min(self) -> np.ndarray:
         """
-        Returns the minimum point of the axis-aligned bounding box.
+        Returns the minimum point of the axis-aligned bounding box as a read-only (3,) array, this is a view of
+        min_max and not a copy. Use get_min().tolist() where a list of floats is needed.
 
         :return: The minimum point of the axis-aligned bounding box
         """
-        return [self.min_x, self.min_y, self.min_z]
+        return self.min_max[0]
 
-    def get_max(self) -> List[float]:
+    def get_max(self) -> np.ndarray:
         """
-        Returns the maximum point of the axis-aligned bounding box.
+        Returns the maximum point of the axis-aligned bounding box as a read-only (3,) array, this is a view of
+        min_max and not a copy. Use get_max().tolist() where a list of floats is needed.
 
         :return: The maximum point of the axis-aligned bounding box
         """
-        return [self.max_x, self.max_y, self.max_z]
+        return self.min_max[1]
+
+    def overlaps_many(self, others: Union[list[AxisAlignedBoundingBox], np.ndarray]) -> np.ndarray:
+        """
+        Checks which of the given axis-aligned bounding boxes overlap this one.
+
+        :param others: The other axis-aligned bounding boxes, either as objects or as an (N, 2, 3) array
+        :return: An (N,) boolean array which is True where the other box overlaps this one
+        """
+        from ..collision_fast import overlaps_batch
+        if not isinstance(others, np.ndarray):
+            others = np.array([other._values for other in others], dtype=np.float64).reshape(-1, 2, 3)
+        return overlaps_batch(others, self.min_max)[:, 0]
+
+    def __eq__(self, other):
+        if not isinstance(other, AxisAlignedBoundingBox):
+            return NotImplemented
+        return self._values == other._values
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return self.__class__.from_min_max, (self._values[:3], self._values[3:])
 
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(min_max={[list(self._values[:3]), list(self._values[3:])]})"
 
-@dataclass
+
+@slotted_dataclass(eq=False)
 class CollisionCallbacks:
     on_collision_cb: Callable
     no_collision_cb: Optional[Callable] = None
 
 
-@dataclass
+@fast_pickle
+@slotted_dataclass(eq=False, repr=False)
 class MultiBody:
+    """
+    Dataclass for storing a multi body that is created from multiple links. The per link values are stored as
+    contiguous numpy arrays, lists that are passed are converted in __post_init__.
+    """
     base_visual_shape_index: int
     base_pose: Pose
-    link_visual_shape_indices: List[int]
-    link_poses: List[Pose]
-    link_masses: List[float]
-    link_inertial_frame_poses: List[Pose]
-    link_parent_indices: List[int]
-    link_joint_types: List[JointType]
-    link_joint_axis: List[Point]
-    link_collision_shape_indices: List[int]
+    link_visual_shape_indices: np.ndarray
+    link_poses: list[Pose]
+    link_masses: np.ndarray
+    link_inertial_frame_poses: list[Pose]
+    link_parent_indices: np.ndarray
+    link_joint_types: np.ndarray
+    link_joint_axis: np.ndarray
+    link_collision_shape_indices: np.ndarray
+
+    def __post_init__(self):
+        self.link_visual_shape_indices = np.ascontiguousarray(self.link_visual_shape_indices, dtype=np.int32)
+        self.link_masses = np.ascontiguousarray(self.link_masses, dtype=np.float64)
+        self.link_parent_indices = np.ascontiguousarray(self.link_parent_indices, dtype=np.int32)
+        self.link_joint_types = np.ascontiguousarray(self.link_joint_types, dtype=np.int32)
+        self.link_joint_axis = np.ascontiguousarray([get_point_as_list(axis) if isinstance(axis, Point) else axis
+                                                     for axis in self.link_joint_axis], dtype=np.float64).reshape(-1, 3)
+        self.link_collision_shape_indices = np.ascontiguousarray(self.link_collision_shape_indices, dtype=np.int32)
+
+
+# Record layout for packing visual shapes into one array. The parameters are interpreted per shape type:
+# p0 holds the half extents of a box, the scale of a mesh or the normal of a plane, p1 holds the length of a
+# capsule or cylinder and p2 holds the radius of a sphere, capsule or cylinder.
+_SHAPE_DTYPE = np.dtype([('type', 'u1'), ('rgba', '4f4'), ('pos', '3f4'), ('p0', '3f4'), ('p1', 'f4'), ('p2', 'f4')])
+
+
+def pack_shapes(shapes: list[VisualShape]) -> np.ndarray:
+    """
+    Packs the given visual shapes into one structured array, such that they can be processed in batches per shape type
+    instead of one by one, see also shapes_of_type.
+
+    :param shapes: The visual shapes that should be packed.
+    :return: A structured array with one record per visual shape.
+    """
+    buf = np.zeros(len(shapes), dtype=_SHAPE_DTYPE)
+    for i, shape in enumerate(shapes):
+        shape.write_record(buf[i])
+    return buf
+
+
+def shapes_of_type(buf: np.ndarray, shape_type: Shape) -> np.ndarray:
+    """
+    Returns the records of the given shape type from an array created by pack_shapes.
+
+    :param buf: The packed visual shapes.
+    :param shape_type: The shape type that should be selected.
+    :return: The records of the given shape type.
+    """
+    return buf[buf['type'] == shape_type.value]
 
 
-@dataclass
+@slotted_dataclass
 class VisualShape(ABC):
     rgba_color: Color
-    visual_frame_position: List[float]
+    visual_frame_position: list[float]
+
+    def to_record(self) -> np.void:
+        """
+        Returns this visual shape as a record of the packed visual shape layout, see also pack_shapes.
+        """
+        record = np.zeros(1, dtype=_SHAPE_DTYPE)[0]
+        self.write_record(record)
+        return record
+
+    def write_record(self, record: np.void) -> None:
+        """
+        Writes this visual shape into the given record of the packed visual shape layout.
+
+        :param record: The record that should be written to.
+        """
+        record['type'] = self.visual_geometry_type.value
+        record['rgba'] = self.rgba_color.get_rgba()
+        record['pos'] = self.visual_frame_position
 
     @abstractmethod
-    def shape_data(self) -> Dict[str, Any]:
+    def shape_data(self) -> dict[str, Any]:
         """
         Returns the shape data of the visual shape (e.g. half extents for a box, radius for a sphere).
         """
@@ -195,48 +556,61 @@ class VisualShape(ABC):
         pass
 
 
-@dataclass
+@slotted_dataclass
 class BoxVisualShape(VisualShape):
-    half_extents: List[float]
+    half_extents: list[float]
 
-    def shape_data(self) -> Dict[str, List[float]]:
+    def shape_data(self) -> dict[str, list[float]]:
         return {"halfExtents": self.half_extents}
 
+    def write_record(self, record: np.void) -> None:
+        super().write_record(record)
+        record['p0'] = self.half_extents
+
     @property
     def visual_geometry_type(self) -> Shape:
         return Shape.BOX
 
     @property
-    def size(self) -> List[float]:
+    def size(self) -> list[float]:
         return self.half_extents
 
 
-@dataclass
+@slotted_dataclass
 class SphereVisualShape(VisualShape):
     radius: float
 
-    def shape_data(self) -> Dict[str, float]:
+    def shape_data(self) -> dict[str, float]:
         return {"radius": self.radius}
 
+    def write_record(self, record: np.void) -> None:
+        super().write_record(record)
+        record['p2'] = self.radius
+
     @property
     def visual_geometry_type(self) -> Shape:
         return Shape.SPHERE
 
 
-@dataclass
+@slotted_dataclass
 class CapsuleVisualShape(VisualShape):
     radius: float
     length: float
 
-    def shape_data(self) -> Dict[str, float]:
+    def shape_data(self) -> dict[str, float]:
         return {"radius": self.radius, "length": self.length}
 
+    def write_record(self, record: np.void) -> None:
+        super().write_record(record)
+        record['p1'] = self.length
+        record['p2'] = self.radius
+
     @property
     def visual_geometry_type(self) -> Shape:
         return Shape.CAPSULE
 
 
-@dataclass
+@slotted_dataclass
 class CylinderVisualShape(CapsuleVisualShape):
 
     @property
@@ -244,55 +618,73 @@ class CylinderVisualShape(CapsuleVisualShape):
         return Shape.CYLINDER
 
 
-@dataclass
+@slotted_dataclass
 class MeshVisualShape(VisualShape):
-    scale: List[float]
+    scale: list[float]
     file_name: str
 
-    def shape_data(self) -> Dict[str, Union[List[float], str]]:
+    def shape_data(self) -> dict[str, Union[list[float], str]]:
         return {"meshScale": self.scale, "meshFileName": self.file_name}
 
+    def write_record(self, record: np.void) -> None:
+        super().write_record(record)
+        record['p0'] = self.scale
+
     @property
     def visual_geometry_type(self) -> Shape:
         return Shape.MESH
 
 
-@dataclass
+@slotted_dataclass
 class PlaneVisualShape(VisualShape):
-    normal: List[float]
+    normal: list[float]
 
-    def shape_data(self) -> Dict[str, List[float]]:
+    def shape_data(self) -> dict[str, list[float]]:
         return {"normal": self.normal}
 
+    def write_record(self, record: np.void) -> None:
+        super().write_record(record)
+        record['p0'] = self.normal
+
     @property
     def visual_geometry_type(self) -> Shape:
         return Shape.PLANE
 
 
-@dataclass
+@slotted_dataclass(eq=False)
 class State(ABC):
     pass
 
 
-@dataclass
+@slotted_dataclass(eq=False, repr=False)
 class LinkState(State):
-    constraint_ids: Dict[Link, int]
+    """
+    The state of a link, the constraint ids are held weakly such that saved states do not keep links alive.
+    """
+    constraint_ids: WeakKeyDictionary[Link, int]
+
+    def __post_init__(self):
+        if not isinstance(self.constraint_ids, WeakKeyDictionary):
+            self.constraint_ids = WeakKeyDictionary(self.constraint_ids)
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(constraint_ids={dict(self.constraint_ids)!r})"
 
 
-@dataclass
+@slotted_dataclass
 class JointState(State):
     position: float
 
 
-@dataclass
+@slotted_dataclass(eq=False)
 class ObjectState(State):
     pose: Pose
-    attachments: Dict[Object, Attachment]
-    link_states: Dict[int, LinkState]
-    joint_states: Dict[int, JointState]
+    attachments: dict[Object, Attachment]
+    link_states: dict[int, LinkState]
+    joint_states: dict[int, JointState]
 
 
-@dataclass
+@slotted_dataclass(eq=False)
 class WorldState(State):
     simulator_state_id: int
-    object_states: Dict[str, ObjectState]
+    object_states: dict[str, ObjectState]
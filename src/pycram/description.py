@@ -208,11 +208,11 @@ class Link(ObjectEntity, LinkDescription, ABC):
 
     @property
     def current_state(self) -> LinkState:
-        return LinkState(self.constraint_ids.copy())
+        return LinkState(self.constraint_ids)
 
     @current_state.setter
     def current_state(self, link_state: LinkState) -> None:
-        self.constraint_ids = link_state.constraint_ids
+        self.constraint_ids = dict(link_state.constraint_ids)
 
     def add_fixed_constraint_with_link(self, child_link: 'Link') -> int:
         """
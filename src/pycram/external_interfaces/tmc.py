@@ -1,60 +1,131 @@
+import threading
+from concurrent.futures import Future
+from queue import Queue
+
 import rospy
-from typing_extensions import Optional
+from typing_extensions import Optional, Dict, Tuple, Any
 
 from ..datastructures.enums import GripperState
 from ..designators.motion_designator import MoveGripperMotion, TalkingMotion
 
-is_init = False
+try:
+    from tmc_control_msgs.msg import GripperApplyEffortActionGoal
+    from tmc_msgs.msg import Voice
+    _TMC_AVAILABLE = True
+except ModuleNotFoundError as e:
+    _TMC_AVAILABLE = False
+    rospy.logwarn("Could not import TMC messages, tmc interface could not be initialized")
+
+# Effort that is applied to the gripper of the HSR for each gripper state
+_GRIPPER_EFFORTS: Dict[GripperState, float] = {GripperState.OPEN: 0.8, GripperState.CLOSE: -0.8}
+
+_publishers: Dict[Tuple[str, type], rospy.Publisher] = {}
+
+
+def _get_pub(topic: str, msg_type: type) -> rospy.Publisher:
+    """
+    Returns the publisher for the given topic and message type, the publisher is created on the first call and reused
+    afterwards. Publishers are latched, so subscribers that connect late still receive the last message and there is
+    no need to wait for subscribers before publishing.
+
+    :param topic: The topic name to publish to
+    :param msg_type: The message type of the topic
+    :return: The publisher for the topic
+    """
+    key = (topic, msg_type)
+    if key not in _publishers:
+        _publishers[key] = rospy.Publisher(topic, msg_type, queue_size=10, latch=True)
+    return _publishers[key]
+
 
+# Messages that are waiting to be published by the publisher thread as (topic, message type, message, future)
+_pub_queue: Queue = Queue(maxsize=32)
+_pub_thread: Optional[threading.Thread] = None
+_pub_thread_lock = threading.Lock()
 
-def init_tmc_interface():
-    global is_init
-    if is_init:
-        return
-    try:
-        from tmc_control_msgs.msg import GripperApplyEffortActionGoal
-        from tmc_msgs.msg import Voice
-        is_init = True
-        rospy.loginfo("Successfully initialized tmc interface")
-    except ModuleNotFoundError as e:
-        rospy.logwarn(f"Could not import TMC messages, tmc interface could not be initialized")
+
+def _publish_worker() -> None:
+    """
+    Publishes the messages from the publisher queue and resolves their futures once they are published. Failures are
+    logged here as well, since callers do not have to wait for the future. Messages whose future was cancelled while
+    they were waiting are skipped, such that they are not published after the motions that came after them.
+    """
+    while True:
+        topic, msg_type, msg, future = _pub_queue.get()
+        try:
+            if not future.set_running_or_notify_cancel():
+                continue
+            _get_pub(topic, msg_type).publish(msg)
+            future.set_result(None)
+        except Exception as e:
+            rospy.logerr(f"Could not publish to {topic}: {e}")
+            future.set_exception(e)
+        finally:
+            _pub_queue.task_done()
 
 
-def tmc_gripper_control(designator: MoveGripperMotion, topic_name: Optional[str] = '/hsrb/gripper_controller/grasp/goal'):
+def _publish_async(topic: str, msg_type: type, msg: Any) -> Future:
     """
-    Publishes a message to the gripper controller to open or close the gripper for the HSR.
+    Hands a message over to the publisher thread, which is started on the first call, and returns immediately.
+
+    :param topic: The topic name to publish to
+    :param msg_type: The message type of the topic
+    :param msg: The message that should be published
+    :return: A future that is resolved once the message is published
+    :raises queue.Full: If too many messages are waiting to be published
+    """
+    global _pub_thread
+    with _pub_thread_lock:
+        if _pub_thread is None:
+            _pub_thread = threading.Thread(target=_publish_worker, daemon=True)
+            _pub_thread.start()
+    future = Future()
+    _pub_queue.put_nowait((topic, msg_type, msg, future))
+    return future
+
+
+def init_tmc_interface() -> bool:
+    """
+    Checks if the TMC messages are available, they are imported once when this module is loaded.
+
+    :return: True if the tmc interface can be used, False otherwise
+    """
+    return _TMC_AVAILABLE
+
+
+def tmc_gripper_control(designator: MoveGripperMotion,
+                        topic_name: Optional[str] = '/hsrb/gripper_controller/grasp/goal') -> Optional[Future]:
+    """
+    Publishes a message to the gripper controller to open or close the gripper for the HSR. The message is published
+    by a background thread, such that this function returns immediately.
 
     :param designator: The designator containing the motion to be executed
     :param topic_name: The topic name to publish the message to
+    :return: A future that is resolved once the message is published, None if the tmc interface is not available
     """
-    if (designator.motion == GripperState.OPEN):
-        pub_gripper = rospy.Publisher(topic_name, GripperApplyEffortActionGoal,
-                                      queue_size=10)
-        rate = rospy.Rate(10)
-        msg = GripperApplyEffortActionGoal()
-        msg.goal.effort = 0.8
-        pub_gripper.publish(msg)
-
-    elif (designator.motion == GripperState.CLOSE):
-        pub_gripper = rospy.Publisher(topic_name, GripperApplyEffortActionGoal,
-                                      queue_size=10)
-        rate = rospy.Rate(10)
-        msg = GripperApplyEffortActionGoal()
-        msg.goal.effort = -0.8
-        pub_gripper.publish(msg)
+    if not _TMC_AVAILABLE:
+        rospy.logwarn_once("TMC messages are not available, the gripper of the HSR can not be controlled")
+        return None
+    msg = GripperApplyEffortActionGoal()
+    msg.goal.effort = _GRIPPER_EFFORTS[designator.motion]
+    return _publish_async(topic_name, GripperApplyEffortActionGoal, msg)
 
 
-def tmc_talk(designator: TalkingMotion, topic_name: Optional[str] = '/talk_request'):
+def tmc_talk(designator: TalkingMotion, topic_name: Optional[str] = '/talk_request') -> Optional[Future]:
     """
-    Publishes a sentence to the talk_request topic of the HSRB robot
+    Publishes a sentence to the talk_request topic of the HSRB robot. The message is published by a background thread,
+    such that this function returns immediately.
 
     :param designator: The designator containing the sentence to be spoken
     :param topic_name: The topic name to publish the sentence to
+    :return: A future that is resolved once the message is published, None if the tmc interface is not available
     """
-    pub = rospy.Publisher(topic_name, Voice, queue_size=10)
+    if not _TMC_AVAILABLE:
+        rospy.logwarn_once("TMC messages are not available, the HSR can not talk")
+        return None
     texttospeech = Voice()
     # language 1 = english (0 = japanese)
     texttospeech.language = 1
     texttospeech.sentence = designator.cmd
 
-    pub.publish(texttospeech)
+    return _publish_async(topic_name, Voice, texttospeech)
@@ -894,7 +894,7 @@ class OntologyManager(object, metaclass=Singleton):
             raise ValueError('Concept name is neither a valid IRI nor a valid short name: the namespace seems missing.')
         # "//" after a ":" indicates a protocol has been specified to the left of the ":", i.e. we have an IRI already.
         recStr = "//"        
-        if recStr != conceptName[idx+1:idx+len(recStr)+1]
+        if recStr != conceptName[idx+1:idx+len(recStr)+1]:
             namespace, name = conceptName[:idx], conceptName[idx+1:]
             conceptIRI = namespaceMap[namespace] + name
         return conceptIRI
@@ -1,7 +1,8 @@
 import numpy as np
 import rospy
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from threading import Lock
-from typing_extensions import Any
+from typing_extensions import Any, Optional
 
 from ..datastructures.enums import ExecutionType
 from ..external_interfaces.tmc import tmc_gripper_control, tmc_talk
@@ -17,6 +18,25 @@ from gtts import gTTS
 
 import io
 
+# Time in seconds the real HSRB process modules wait for a message of the tmc interface to be published
+TMC_PUBLISH_TIMEOUT = 5.0
+
+
+def _wait_for_tmc(future: Optional[Future]) -> None:
+    """
+    Waits until a message of the tmc interface is published. A message that is not published in time is cancelled, such
+    that it is not published later on, after the motions that follow it.
+
+    :param future: The future returned by the tmc interface, None if the tmc interface is not available
+    """
+    if future is None:
+        return
+    try:
+        future.result(timeout=TMC_PUBLISH_TIMEOUT)
+    except FutureTimeoutError:
+        future.cancel()
+        raise
+
 
 class HSRBNavigation(ProcessModule):
     """
@@ -120,7 +140,7 @@ class HSRBMoveGripperReal(ProcessModule):
      """
 
     def _execute(self, designator: MoveGripperMotion) -> Any:
-        tmc_gripper_control(designator)
+        _wait_for_tmc(tmc_gripper_control(designator))
 
 
 class HSRBOpenReal(ProcessModule):
@@ -151,7 +171,7 @@ class HSRBTalkReal(ProcessModule):
     """
 
     def _execute(self, designator: TalkingMotion) -> Any:
-        tmc_talk(designator)
+        _wait_for_tmc(tmc_talk(designator))
 
 
 ###########################################################
@@ -278,20 +278,20 @@ class BulletWorld(World):
 
     def create_multi_body(self, multi_body: MultiBody) -> int:
         return p.createMultiBody(baseVisualShapeIndex=-multi_body.base_visual_shape_index,
-                                 linkVisualShapeIndices=multi_body.link_visual_shape_indices,
+                                 linkVisualShapeIndices=multi_body.link_visual_shape_indices.tolist(),
                                  basePosition=multi_body.base_pose.position_as_list(),
                                  baseOrientation=multi_body.base_pose.orientation_as_list(),
                                  linkPositions=[pose.position_as_list() for pose in multi_body.link_poses],
-                                 linkMasses=multi_body.link_masses,
+                                 linkMasses=multi_body.link_masses.tolist(),
                                  linkOrientations=[pose.orientation_as_list() for pose in multi_body.link_poses],
                                  linkInertialFramePositions=[pose.position_as_list()
                                                              for pose in multi_body.link_inertial_frame_poses],
                                  linkInertialFrameOrientations=[pose.orientation_as_list()
                                                                 for pose in multi_body.link_inertial_frame_poses],
-                                 linkParentIndices=multi_body.link_parent_indices,
-                                 linkJointTypes=multi_body.link_joint_types,
-                                 linkJointAxis=[[point.x, point.y, point.z] for point in multi_body.link_joint_axis],
-                                 linkCollisionShapeIndices=multi_body.link_collision_shape_indices)
+                                 linkParentIndices=multi_body.link_parent_indices.tolist(),
+                                 linkJointTypes=multi_body.link_joint_types.tolist(),
+                                 linkJointAxis=multi_body.link_joint_axis.tolist(),
+                                 linkCollisionShapeIndices=multi_body.link_collision_shape_indices.tolist())
 
     def get_images_for_target(self,
                               target_pose: Pose,
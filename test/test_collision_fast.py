@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+
+from pycram.collision_fast import overlaps, overlaps_batch, _overlaps_batch_kernel
+
+
+class TestCollisionFast(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(42)
+        # Rounded coordinates such that some of the boxes only touch each other.
+        mins = np.round(rng.uniform(-2, 2, (40, 3)), 1)
+        maxs = mins + np.round(rng.uniform(0, 1, (40, 3)), 1)
+        cls.boxes = np.stack([mins, maxs], axis=1)
+
+    def test_overlaps_batch_matches_kernel(self):
+        boxes_a, boxes_b = self.boxes[:25], self.boxes[15:]
+        expected = _overlaps_batch_kernel(boxes_a, boxes_b)
+        self.assertTrue(expected.any())
+        self.assertFalse(expected.all())
+        np.testing.assert_array_equal(overlaps_batch(boxes_a, boxes_b), expected)
+        np.testing.assert_array_equal(overlaps(boxes_a[:, None], boxes_b[None, :]), expected)
+
+    def test_touching_boxes_overlap(self):
+        box = np.array([[0, 0, 0], [1, 1, 1]], dtype=np.float64)
+        others = np.array([[[1, 1, 1], [2, 2, 2]], [[1.1, 0, 0], [2, 1, 1]]], dtype=np.float64)
+        self.assertEqual(overlaps_batch(box, others).tolist(), [[True, False]])
+        self.assertEqual(overlaps(box, others).tolist(), [True, False])
+
+    def test_nan_boxes_do_not_overlap(self):
+        box = np.array([[0, 0, 0], [1, 1, 1]], dtype=np.float64)
+        others = np.array([[[np.nan, 0, 0], [2, 1, 1]], [[0, 0, 0], [2, np.nan, 1]], [[0, 0, 0], [2, 1, 1]]])
+        expected = [[False, False, True]]
+        self.assertEqual(_overlaps_batch_kernel(box[None], others).tolist(), expected)
+        self.assertEqual(overlaps_batch(box, others).tolist(), expected)
+        self.assertEqual(overlaps_batch(others, box).tolist(), [[False], [False], [True]])
+        self.assertEqual(overlaps(box, others).tolist(), expected[0])
@@ -0,0 +1,308 @@
+import copy
+import gc
+import pickle
+import unittest
+
+import numpy as np
+
+from pycram.datastructures.dataclasses import (slotted_dataclass, fast_pickle, Color, MultiBody,
+                                               AxisAlignedBoundingBox, LinkState, JointState, WorldState,
+                                               BoxVisualShape, SphereVisualShape, CapsuleVisualShape,
+                                               CylinderVisualShape, MeshVisualShape, PlaneVisualShape, pack_shapes,
+                                               shapes_of_type)
+from pycram.datastructures.enums import Shape
+
+
+@slotted_dataclass
+class Base:
+    a: int
+    b: list = None
+
+    def describe(self):
+        return f"{self.a}"
+
+
+@slotted_dataclass
+class Derived(Base):
+    c: float = 0.0
+
+    def describe(self):
+        return f"{super().describe()} {self.c}"
+
+
+@fast_pickle
+@slotted_dataclass
+class Pickled(Derived):
+    d: str = ""
+
+
+class TestSlottedDataclass(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        for instance in (Base(1), Derived(1, [2], 3.0), JointState(0.5),
+                         BoxVisualShape(Color(), [0, 0, 0], [1, 1, 1])):
+            self.assertFalse(hasattr(instance, '__dict__'), type(instance))
+        with self.assertRaises(AttributeError):
+            Base(1).d = 2
+
+    def test_inheritance_chain(self):
+        self.assertEqual(Base.__slots__, ('a', 'b'))
+        self.assertEqual(Derived.__slots__, ('c',))
+        derived = Derived(1, [2], 3.0)
+        self.assertEqual((derived.a, derived.b, derived.c), (1, [2], 3.0))
+        self.assertEqual(Derived(1).c, 0.0)
+        self.assertEqual(derived.describe(), "1 3.0")
+
+    def test_dataclass_methods(self):
+        self.assertEqual(Derived(1, [2], 3.0), Derived(1, [2], 3.0))
+        self.assertNotEqual(Derived(1, [2], 3.0), Derived(1, [2], 4.0))
+        self.assertEqual(repr(Derived(1)), "Derived(a=1, b=None, c=0.0)")
+
+    def test_pickle(self):
+        derived = Derived(1, [2], 3.0)
+        self.assertEqual(pickle.loads(pickle.dumps(derived)), derived)
+        self.assertEqual(pickle.loads(pickle.dumps(JointState(0.5))), JointState(0.5))
+
+    def test_deepcopy(self):
+        derived = Derived(1, [2], 3.0)
+        copied = copy.deepcopy(derived)
+        self.assertEqual(copied, derived)
+        self.assertIsNot(copied.b, derived.b)
+
+
+class TestFastPickle(unittest.TestCase):
+
+    def test_state_is_tuple(self):
+        self.assertEqual(Pickled(1, [2], 3.0, "x").__getstate__(), (1, [2], 3.0, "x"))
+
+    def test_dataclass_round_trip(self):
+        pickled = Pickled(1, [2], 3.0, "x")
+        self.assertEqual(pickle.loads(pickle.dumps(pickled)), pickled)
+        self.assertEqual(copy.deepcopy(pickled), pickled)
+
+    def test_color_round_trip(self):
+        color = Color(0.5, 0.25, 0.125, 1)
+        self.assertEqual(pickle.loads(pickle.dumps(color)), color)
+
+    def test_shared_color_stays_read_only(self):
+        copied = pickle.loads(pickle.dumps(Color.get(0.5, 0.25, 0.125, 1)))
+        self.assertEqual(copied, Color(0.5, 0.25, 0.125, 1))
+        with self.assertRaises(AttributeError):
+            copied.R = 0
+        self.assertIs(copied, Color.get(0.5, 0.25, 0.125, 1))
+
+    def test_multi_body_round_trip(self):
+        multi_body = MultiBody(0, None, [1, 2], [], [0.5, 1.5], [], [0, 1], [0, 0], [[0, 0, 1], [1, 0, 0]], [-1, -1])
+        copied = pickle.loads(pickle.dumps(multi_body))
+        self.assertEqual(copied.link_visual_shape_indices.tolist(), [1, 2])
+        self.assertEqual(copied.link_masses.tolist(), [0.5, 1.5])
+        self.assertEqual(copied.link_joint_axis.tolist(), [[0, 0, 1], [1, 0, 0]])
+        self.assertEqual(copied.link_collision_shape_indices.dtype, multi_body.link_collision_shape_indices.dtype)
+
+
+class TestColor(unittest.TestCase):
+
+    def test_color_keeps_float_values(self):
+        color = Color.from_list([0.5, 0.25, 0.125])
+        self.assertEqual(color.get_rgba(), [0.5, 0.25, 0.125, 1])
+        self.assertEqual(color.get_rgb(), [0.5, 0.25, 0.125])
+
+    def test_color_equality(self):
+        self.assertEqual(Color(1, 0, 0, 1), Color.from_rgba([1, 0, 0, 1]))
+        self.assertNotEqual(Color(1, 0, 0, 1), Color(1, 0, 0, 0.5))
+
+    def test_from_list3(self):
+        self.assertEqual(Color.from_list3([0.5, 0.25, 0.125]), Color(0.5, 0.25, 0.125, 1))
+        self.assertEqual(Color.from_list3((0.5, 0.25, 0.125, 0.5)), Color(0.5, 0.25, 0.125, 1))
+        self.assertEqual(Color.from_rgb([0.5, 0.25, 0.125]), Color(0.5, 0.25, 0.125, 1))
+
+    def test_from_list4(self):
+        self.assertEqual(Color.from_list4([0.5, 0.25, 0.125, 0.5]), Color(0.5, 0.25, 0.125, 0.5))
+        self.assertEqual(Color.from_rgba(np.array([0.5, 0.25, 0.125, 0.5])), Color(0.5, 0.25, 0.125, 0.5))
+        with self.assertRaises(IndexError):
+            Color.from_list4([0.5, 0.25, 0.125])
+
+    def test_from_list_dispatches_on_length(self):
+        self.assertEqual(Color.from_list([0.5, 0.25, 0.125]), Color(0.5, 0.25, 0.125, 1))
+        self.assertEqual(Color.from_list((0.5, 0.25, 0.125, 0.5)), Color(0.5, 0.25, 0.125, 0.5))
+        self.assertEqual(Color.from_list(np.array([0.5, 0.25, 0.125, 0.5])), Color(0.5, 0.25, 0.125, 0.5))
+
+    def test_from_list_wrong_length(self):
+        for color in ([], [0.5, 0.25], [0.5, 0.25, 0.125, 0.5, 1]):
+            with self.assertRaises(ValueError):
+                Color.from_list(color)
+
+    def test_get_returns_shared_instance(self):
+        self.assertIs(Color.get(0.5, 0.25, 0.125, 1), Color.get(0.5, 0.25, 0.125, 1))
+        self.assertIs(Color.from_list([0.5, 0.25, 0.125]), Color.get(0.5, 0.25, 0.125, 1))
+        self.assertIsNot(Color.get(0.5, 0.25, 0.125, 1), Color.get(0.5, 0.25, 0.125, 0.5))
+        self.assertIsNot(Color(0.5, 0.25, 0.125, 1), Color(0.5, 0.25, 0.125, 1))
+
+    def test_shared_instance_is_read_only(self):
+        color = Color.get(0.5, 0.25, 0.125, 1)
+        with self.assertRaises(AttributeError):
+            color.R = 0
+        with self.assertRaises(AttributeError):
+            del color.G
+        self.assertEqual(color.get_rgba(), [0.5, 0.25, 0.125, 1])
+
+    def test_new_color_can_be_changed(self):
+        color = Color(0.5, 0.25, 0.125, 1)
+        color.R = 0
+        self.assertEqual(color.get_rgba(), [0, 0.25, 0.125, 1])
+        self.assertEqual(Color.get(0.5, 0.25, 0.125, 1).R, 0.5)
+
+    def test_get_quantizes_values(self):
+        self.assertIs(Color.get(0.5, 0.25, 0.125, 1), Color.get(0.5 + 1e-9, 0.25, 0.125, 1))
+
+    def test_subclass_gets_own_shared_instance(self):
+        class MyColor(Color):
+            __slots__ = ()
+
+        for color in (MyColor.get(0.5, 0.25, 0.125, 1), MyColor.from_rgb([0.5, 0.25, 0.125]),
+                      MyColor.from_list([0.5, 0.25, 0.125, 1]), MyColor.from_rgba([0.5, 0.25, 0.125, 1])):
+            self.assertIsInstance(color, MyColor)
+            self.assertIs(color, MyColor.get(0.5, 0.25, 0.125, 1))
+        self.assertNotIsInstance(Color.get(0.5, 0.25, 0.125, 1), MyColor)
+
+    def test_nan_colors_are_not_shared(self):
+        size = len(Color._INTERN), len(Color._INTERN_EXACT)
+        color = Color.get(float('nan'), 0, 0, 1)
+        self.assertIsNot(color, Color.get(float('nan'), 0, 0, 1))
+        self.assertEqual((len(Color._INTERN), len(Color._INTERN_EXACT)), size)
+        self.assertEqual(color.get_rgba()[1:], [0, 0, 1])
+
+    def test_shared_instances_are_bounded(self):
+        for i in range(Color._INTERN_SIZE + 10):
+            Color.get(i / 65535, 0, 0, 1)
+        self.assertLessEqual(len(Color._INTERN), Color._INTERN_SIZE)
+        self.assertLessEqual(len(Color._INTERN_EXACT), Color._INTERN_SIZE)
+
+
+class TestAxisAlignedBoundingBox(unittest.TestCase):
+
+    def test_from_min_max(self):
+        aabb = AxisAlignedBoundingBox.from_min_max([0, 1, 2], [3, 4, 5])
+        self.assertEqual([aabb.min_x, aabb.min_y, aabb.min_z], [0, 1, 2])
+        self.assertEqual([aabb.max_x, aabb.max_y, aabb.max_z], [3, 4, 5])
+        self.assertEqual(aabb.min_max.tolist(), [[0, 1, 2], [3, 4, 5]])
+        self.assertEqual(aabb, AxisAlignedBoundingBox(np.array([[0, 1, 2], [3, 4, 5]])))
+
+    def test_arrays_are_read_only(self):
+        aabb = AxisAlignedBoundingBox.from_min_max([0, 1, 2], [3, 4, 5])
+        with self.assertRaises(ValueError):
+            aabb.get_min()[0] = 1
+        with self.assertRaises(ValueError):
+            aabb.as_array()[1, 0] = 1
+        self.assertEqual(aabb.get_min().tolist(), [0, 1, 2])
+        self.assertEqual(aabb.get_max().tolist(), [3, 4, 5])
+
+    def test_min_max_points_are_not_shared(self):
+        aabb = AxisAlignedBoundingBox.from_min_max([0, 1, 2], [3, 4, 5])
+        min_point, max_point = aabb.get_min_max_points()
+        min_point.x = 10
+        self.assertEqual(aabb.get_min_point().x, 0)
+        self.assertEqual(aabb.min_x, 0)
+        self.assertEqual(max_point.z, 5)
+
+    def test_from_arrays(self):
+        boxes = AxisAlignedBoundingBox.from_arrays([[0, 0, 0], [1, 1, 1]], [[1, 1, 1], [2, 2, 2]])
+        self.assertEqual(boxes.shape, (2, 2, 3))
+        self.assertEqual(boxes[1].tolist(), [[1, 1, 1], [2, 2, 2]])
+
+    def test_overlaps_many(self):
+        aabb = AxisAlignedBoundingBox.from_min_max([0, 0, 0], [1, 1, 1])
+        others = [AxisAlignedBoundingBox.from_min_max([0.5, 0.5, 0.5], [2, 2, 2]),
+                  AxisAlignedBoundingBox.from_min_max([1, 1, 1], [2, 2, 2]),
+                  AxisAlignedBoundingBox.from_min_max([1.5, 0, 0], [2, 1, 1])]
+        self.assertEqual(aabb.overlaps_many(others).tolist(), [True, True, False])
+        batch = AxisAlignedBoundingBox.from_arrays([[0.5, 0.5, 0.5], [1.5, 0, 0]], [[2, 2, 2], [2, 1, 1]])
+        self.assertEqual(aabb.overlaps_many(batch).tolist(), [True, False])
+
+    def test_pickle(self):
+        aabb = AxisAlignedBoundingBox.from_min_max([0, 1, 2], [3, 4, 5])
+        copied = pickle.loads(pickle.dumps(aabb))
+        self.assertEqual(copied, aabb)
+        self.assertFalse(copied.min_max.flags.writeable)
+
+
+class TestLinkState(unittest.TestCase):
+
+    class FakeLink:
+        pass
+
+    def test_link_is_freed(self):
+        link = self.FakeLink()
+        link_state = LinkState({link: 1})
+        self.assertEqual(dict(link_state.constraint_ids), {link: 1})
+        del link
+        gc.collect()
+        self.assertEqual(len(link_state.constraint_ids), 0)
+
+    def test_compared_by_identity(self):
+        link = self.FakeLink()
+        link_state = LinkState({link: 1})
+        self.assertEqual(link_state, link_state)
+        self.assertNotEqual(link_state, LinkState({link: 1}))
+        self.assertNotEqual(WorldState(1, {}), WorldState(1, {}))
+        self.assertEqual(JointState(0.5), JointState(0.5))
+
+    def test_repr_shows_constraint_ids(self):
+        self.assertEqual(repr(LinkState({})), "LinkState(constraint_ids={})")
+
+
+class TestVisualShapeRecords(unittest.TestCase):
+
+    color = Color(1, 0, 0, 1)
+    position = [1, 2, 3]
+
+    def assert_common_fields(self, record, shape_type: Shape):
+        self.assertEqual(record['type'], shape_type.value)
+        self.assertEqual(record['rgba'].tolist(), [1, 0, 0, 1])
+        self.assertEqual(record['pos'].tolist(), self.position)
+
+    def test_box_record(self):
+        record = BoxVisualShape(self.color, self.position, [0.5, 0.25, 0.125]).to_record()
+        self.assert_common_fields(record, Shape.BOX)
+        self.assertEqual(record['p0'].tolist(), [0.5, 0.25, 0.125])
+
+    def test_sphere_record(self):
+        record = SphereVisualShape(self.color, self.position, 0.5).to_record()
+        self.assert_common_fields(record, Shape.SPHERE)
+        self.assertEqual(record['p2'], 0.5)
+
+    def test_capsule_record(self):
+        record = CapsuleVisualShape(self.color, self.position, 0.5, 2).to_record()
+        self.assert_common_fields(record, Shape.CAPSULE)
+        self.assertEqual(record['p1'], 2)
+        self.assertEqual(record['p2'], 0.5)
+
+    def test_cylinder_record(self):
+        record = CylinderVisualShape(self.color, self.position, 0.5, 2).to_record()
+        self.assert_common_fields(record, Shape.CYLINDER)
+        self.assertEqual(record['p1'], 2)
+        self.assertEqual(record['p2'], 0.5)
+
+    def test_mesh_record(self):
+        record = MeshVisualShape(self.color, self.position, [1, 1, 2], "mesh.stl").to_record()
+        self.assert_common_fields(record, Shape.MESH)
+        self.assertEqual(record['p0'].tolist(), [1, 1, 2])
+
+    def test_plane_record(self):
+        record = PlaneVisualShape(self.color, self.position, [0, 0, 1]).to_record()
+        self.assert_common_fields(record, Shape.PLANE)
+        self.assertEqual(record['p0'].tolist(), [0, 0, 1])
+
+    def test_pack_shapes(self):
+        shapes = [BoxVisualShape(self.color, self.position, [1, 1, 1]),
+                  SphereVisualShape(self.color, self.position, 0.5),
+                  CylinderVisualShape(self.color, self.position, 0.25, 2),
+                  SphereVisualShape(self.color, self.position, 1.5),
+                  CapsuleVisualShape(self.color, self.position, 0.75, 3)]
+        buf = pack_shapes(shapes)
+        self.assertEqual(len(buf), len(shapes))
+        self.assertEqual(buf['type'].tolist(), [shape.visual_geometry_type.value for shape in shapes])
+        self.assertEqual(shapes_of_type(buf, Shape.SPHERE)['p2'].tolist(), [0.5, 1.5])
+        self.assertEqual(shapes_of_type(buf, Shape.CYLINDER)['p1'].tolist(), [2])
+        self.assertEqual(shapes_of_type(buf, Shape.CAPSULE)['p1'].tolist(), [3])
+        self.assertEqual(len(shapes_of_type(buf, Shape.MESH)), 0)